@@ -1,17 +1,21 @@
 """
 Code Made Easy - Main Agent Controller
 """
-import google.generativeai as genai
 from enum import Enum, auto
-from typing import Optional
+from typing import TYPE_CHECKING, Optional
+import sys
 import time
-from core.rich_ui import console, print_header, print_user_msg, print_bot_msg, print_error, print_success, clear_screen, print_menu
+from rich.table import Table
+from rich.text import Text
+from rich import box
+from core.rich_ui import console, print_header, print_user_msg, print_bot_msg, print_error, print_success, clear_screen, print_menu, menu_items
 from core.logger import ChatLogger
 
 from .storage import BugStorage
-from .debugger import CodeDebugger
-from .generator import CodeGenerator
-from .rater import CodeRater
+from .llm_cache import LLMCache
+
+if TYPE_CHECKING:
+    import google.generativeai as genai
 
 class CodeFeature(Enum):
     """Features available in Code Made Easy."""
@@ -31,13 +35,20 @@ class CodeMadeEasy:
         '4': {'name': 'View Bug History', 'description': 'Review past mistakes', 'icon': '📜'},
         '0': {'name': 'Back to Main Menu', 'description': 'Return to agent selection', 'icon': '🔙'},
     }
+    MENU_ITEMS = menu_items(MENU_OPTIONS)
 
-    def __init__(self, model: genai.GenerativeModel):
+    def __init__(self, model: "genai.GenerativeModel"):
+        # Imported here so loading the agents package stays light until the tool opens
+        from .debugger import CodeDebugger
+        from .generator import CodeGenerator
+        from .rater import CodeRater
+        
         self.model = model
         self.storage = BugStorage()
-        self.debugger = CodeDebugger(model, self.storage)
-        self.generator = CodeGenerator(model)
-        self.rater = CodeRater(model)
+        self.cache = LLMCache()
+        self.debugger = CodeDebugger(model, self.storage, self.cache)
+        self.generator = CodeGenerator(model, self.cache)
+        self.rater = CodeRater(model, self.cache)
         self.session_messages = []
     
     def _log_interaction(self, user_text: str, bot_text: str, context: str = ""):
@@ -50,6 +61,16 @@ class CodeMadeEasy:
         console.print(f"[bold cyan]{prompt}[/bold cyan]")
         console.print("[dim](Type 'END' on a new line to finish)[/dim]")
         
+        if not sys.stdin.isatty():
+            # Piped input: read raw lines without a styled prompt per line
+            lines = []
+            for line in iter(sys.stdin.readline, ''):
+                line = line.rstrip('\r\n')
+                if line.strip() == 'END':
+                    break
+                lines.append(line)
+            return "\n".join(lines)
+        
         lines = []
         while True:
             try:
@@ -57,39 +78,45 @@ class CodeMadeEasy:
                 if line.strip() == 'END':
                     break
                 lines.append(line)
+            except EOFError:
+                break # Ctrl-D / Ctrl-Z also finishes the paste
             except KeyboardInterrupt:
                 return ""
         return "\n".join(lines)
 
     def run(self):
         """Main execution loop for Code Made Easy."""
-        while True:
-            clear_screen()
-            print_header("Code Made Easy", "Debug • Generate • Optimize")
-            print_menu(self.MENU_OPTIONS, "CODE TOOLS")
+        try:
+            while True:
+                clear_screen()
+                print_header("Code Made Easy", "Debug • Generate • Optimize")
+                print_menu(self.MENU_ITEMS, "CODE TOOLS")
             
-            choice = console.input("\n[bold cyan]👉 Choice:[/bold cyan] ").strip()
+                choice = console.input("\n[bold cyan]👉 Choice:[/bold cyan] ").strip()
             
-            if choice == '1':
-                self._run_debugger()
-            elif choice == '2':
-                self._run_generator()
-            elif choice == '3':
-                self._run_rater()
-            elif choice == '4':
-                self._view_bug_history()
-            elif choice == '0':
-                if self.session_messages:
-                    console.print("\n")
-                    save = console.input("[yellow]💾 Save coding session? (y/n): [/yellow]").strip().lower()
-                    if save in ['yes', 'y']:
-                        title = console.input("[yellow]   Title: [/yellow]").strip()
-                        ChatLogger.save_chat("Code Made Easy", self.session_messages, title if title else "Coding Session")
-                        print_success("Saved!")
-                break
-            else:
-                print_error("Invalid choice. Please try again.")
-                time.sleep(1)
+                if choice == '1':
+                    self._run_debugger()
+                elif choice == '2':
+                    self._run_generator()
+                elif choice == '3':
+                    self._run_rater()
+                elif choice == '4':
+                    self._view_bug_history()
+                elif choice == '0':
+                    if self.session_messages:
+                        console.print("\n")
+                        save = console.input("[yellow]💾 Save coding session? (y/n): [/yellow]").strip().lower()
+                        if save in ['yes', 'y']:
+                            title = console.input("[yellow]   Title: [/yellow]").strip()
+                            ChatLogger.save_chat("Code Made Easy", self.session_messages, title if title else "Coding Session")
+                            print_success("Saved!")
+                    break
+                else:
+                    print_error("Invalid choice. Please try again.")
+                    time.sleep(1)
+        finally:
+            # Also on Ctrl-C, so queued bug records reach disk before the next visit loads them
+            self.storage.close()
 
     def _run_debugger(self):
         """Run the debugger workflow."""
@@ -215,13 +242,29 @@ class CodeMadeEasy:
             console.print("\n[italic yellow]📭 No bugs recorded yet. Start debugging to build your history![/italic yellow]")
         else:
             console.print(f"[bold]📜 Found {len(bugs)} bug reports:[/bold]")
+            # One table for all records: a single layout pass with shared column widths
+            table = Table(title="Bug History", box=box.ROUNDED, border_style="cyan", show_lines=True)
+            table.add_column("#", justify="right", style="bold cyan")
+            table.add_column("Date", no_wrap=True)
+            table.add_column("Language")
+            table.add_column("Error Type")
+            table.add_column("Mistake")
+            table.add_column("Explanation", ratio=1)
             for i, bug in enumerate(reversed(bugs), 1):
-                console.print(f"\n[bold cyan]--- Bug #{i} ---[/bold cyan]")
-                console.print(bug.display()) 
+                table.add_row(
+                    str(i),
+                    Text(bug.date),
+                    Text(bug.language),
+                    Text(bug.error_type),
+                    Text(bug.mistake[:40]),
+                    Text(" ".join(bug.explanation[:80].split()))
+                )
+            console.print(table)
         
+        console.print(f"\n[dim]🗄️ Response cache: {self.cache.hits} hits / {self.cache.misses} misses this session[/dim]")
         console.input("\n[dim]Press Enter to return...[/dim]")
 
-def run_code_made_easy(model: genai.GenerativeModel) -> None:
+def run_code_made_easy(model: "genai.GenerativeModel") -> None:
     """Main entry for Code Made Easy."""
     app = CodeMadeEasy(model)
     app.run()
@@ -1,8 +1,12 @@
 """
 Code Debugger - AI-powered debugging agent
 """
-import google.generativeai as genai
+from typing import TYPE_CHECKING, Optional
 from .storage import BugStorage
+from .llm_cache import LLMCache, cached
+
+if TYPE_CHECKING:
+    import google.generativeai as genai
 
 class CodeDebugger:
     """AI Code Debugger - Find and fix bugs in beginner-friendly language."""
@@ -35,12 +39,18 @@ Help the user fix code fast, not teach theory.
 ❌ No motivational text
 """
 
-    def __init__(self, model: genai.GenerativeModel, storage: BugStorage):
+    def __init__(self, model: "genai.GenerativeModel", storage: BugStorage, cache: Optional[LLMCache] = None):
         """Initialize the debugger."""
         self.model = model
         self.storage = storage
+        self.cache = cache or LLMCache()
         self.chat = model.start_chat(history=[])
     
+    @cached("debug")
+    def _analyze(self, prompt: str) -> str:
+        """Send a debug prompt to the model."""
+        return self.chat.send_message(prompt).text
+    
     def debug_code(self, code: str, language: str) -> str:
         """
         Debug the provided code and return analysis.
@@ -66,8 +76,7 @@ Please analyze this code thoroughly and help the user understand and fix any iss
 """
         
         try:
-            response = self.chat.send_message(prompt)
-            analysis = response.text
+            analysis = self._analyze(prompt)
             
             # Save to bug history
             self.storage.add_bugs_from_analysis(language, analysis)
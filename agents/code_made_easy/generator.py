@@ -1,7 +1,11 @@
 """
 Code Generator - AI-powered code generation agent
 """
-import google.generativeai as genai
+from typing import TYPE_CHECKING, Optional
+from .llm_cache import LLMCache, cached
+
+if TYPE_CHECKING:
+    import google.generativeai as genai
 
 class CodeGenerator:
     """AI Code Generator - Generate code from plain English descriptions."""
@@ -42,13 +46,19 @@ Say: "add comments"
         'converter': 'Create a converter that...',
     }
 
-    def __init__(self, model: genai.GenerativeModel):
+    def __init__(self, model: "genai.GenerativeModel", cache: Optional[LLMCache] = None):
         """Initialize the code generator."""
         self.model = model
+        self.cache = cache or LLMCache()
         self.chat = model.start_chat(history=[])
         self.last_code = None
         self.last_language = None
     
+    @cached("generate")
+    def _generate(self, prompt: str) -> str:
+        """Send a generation prompt to the model."""
+        return self.chat.send_message(prompt).text
+    
     def _validate_and_format(self, text: str) -> str:
         """Validate and format the generated code output."""
         # Check for code block
@@ -90,8 +100,7 @@ Please generate complete, working code that fulfills this request.
 """
         
         try:
-            response = self.chat.send_message(prompt)
-            formatted_text = self._validate_and_format(response.text)
+            formatted_text = self._validate_and_format(self._generate(prompt))
             self.last_code = formatted_text
             self.last_language = language
             return formatted_text
@@ -157,6 +166,6 @@ Please answer in a beginner-friendly way with examples if helpful.
     
     def reset(self):
         """Reset the generator state."""
-        self.chat = self.model.start_chat(history=[])
+        self.chat.history = []
         self.last_code = None
         self.last_language = None
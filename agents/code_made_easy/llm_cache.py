@@ -0,0 +1,91 @@
+"""
+LLM Cache - Exact-match response cache for Code Made Easy
+"""
+import functools
+import hashlib
+import json
+import os
+from typing import Optional
+
+class FileCacheBackend:
+    """Stores one JSON blob per cache key in a directory."""
+
+    def __init__(self, directory: str = "llm_cache"):
+        """Initialize the file backend."""
+        self.directory = directory
+
+    def _path(self, key: str) -> str:
+        return os.path.join(self.directory, f"{key}.json")
+
+    def get(self, key: str) -> Optional[str]:
+        """Return the cached response for a key, if any."""
+        try:
+            with open(self._path(key), 'r', encoding='utf-8') as f:
+                return json.load(f)['response']
+        except (OSError, json.JSONDecodeError, KeyError):
+            return None
+
+    def set(self, key: str, response: str):
+        """Store a response under a key."""
+        os.makedirs(self.directory, exist_ok=True)
+        with open(self._path(key), 'w', encoding='utf-8') as f:
+            json.dump({'response': response}, f, ensure_ascii=False)
+
+class LLMCache:
+    """Prompt-keyed response cache with hit/miss counters."""
+
+    def __init__(self, backend: Optional[FileCacheBackend] = None):
+        """Initialize the cache."""
+        self.backend = backend or FileCacheBackend()
+        self.hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def make_key(**fields) -> str:
+        """Build a stable SHA-256 key from the request fields."""
+        payload = json.dumps(fields, sort_keys=True, ensure_ascii=False)
+        return hashlib.sha256(payload.encode('utf-8')).hexdigest()
+
+    def get(self, key: str) -> Optional[str]:
+        """Look up a key and update the counters."""
+        response = self.backend.get(key)
+        if response is None:
+            self.misses += 1
+        else:
+            self.hits += 1
+        return response
+
+    def set(self, key: str, response: str):
+        """Store a response."""
+        self.backend.set(key, response)
+
+def replay_turn(chat, prompt: str, response: str):
+    """Append a prompt/response pair to a chat session's history."""
+    chat.history = [
+        *chat.history,
+        {"role": "user", "parts": [prompt]},
+        {"role": "model", "parts": [response]},
+    ]
+
+def cached(fn: str):
+    """
+    Cache a ``method(self, prompt) -> str`` model call on ``self.cache``.
+
+    The wrapped method must raise on failure so errors are never stored. On a
+    hit the turn is replayed into ``self.chat`` so follow-up questions still
+    see it in the conversation.
+    """
+    def decorator(method):
+        @functools.wraps(method)
+        def wrapper(self, prompt: str) -> str:
+            key = LLMCache.make_key(fn=fn, prompt=prompt)
+            response = self.cache.get(key)
+            if response is not None:
+                replay_turn(self.chat, prompt, response)
+                return response
+
+            response = method(self, prompt)
+            self.cache.set(key, response)
+            return response
+        return wrapper
+    return decorator
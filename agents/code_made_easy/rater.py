@@ -1,7 +1,14 @@
 """
 Code Rater - AI-powered code review agent
 """
-import google.generativeai as genai
+import asyncio
+import re
+from typing import TYPE_CHECKING, Optional
+from core.genai_client import run_async
+from .llm_cache import LLMCache, cached, replay_turn
+
+if TYPE_CHECKING:
+    import google.generativeai as genai
 
 class CodeRater:
     """Rate My Programme - Review and rate code quality."""
@@ -35,12 +42,54 @@ Use case 1
 ❌ No tutorials
 """
 
-    def __init__(self, model: genai.GenerativeModel):
+    # Independent review angles, requested concurrently: (heading, focus)
+    ASPECTS = {
+        'style': ("🎨 Style & Readability", "naming, formatting, structure and readability"),
+        'security': ("🔒 Security", "input handling, injection risks, secrets and unsafe calls"),
+        'correctness': ("✅ Correctness", "logic errors, edge cases and error handling"),
+        'perf': ("⚡ Performance", "algorithmic complexity, wasted work and memory use"),
+    }
+    
+    SCORE_PATTERN = re.compile(r"Score:\s*(\d+(?:\.\d+)?)\s*/\s*10")
+
+    def __init__(self, model: "genai.GenerativeModel", cache: Optional[LLMCache] = None):
         """Initialize the code rater."""
         self.model = model
+        self.cache = cache or LLMCache()
         self.chat = model.start_chat(history=[])
         self.last_review = None
     
+    @cached("rate")
+    def _review(self, prompt: str) -> str:
+        """Review every aspect concurrently and merge the results."""
+        # On Ctrl-C, run_async cancels the gathered requests before re-raising
+        review = run_async(self._review_aspects(prompt))
+        # Keep the merged review in the chat so follow-up questions can use it
+        replay_turn(self.chat, prompt, review)
+        return review
+    
+    async def _review_aspects(self, prompt: str) -> str:
+        """Request one review per aspect in parallel and join them under headings."""
+        responses = await asyncio.gather(*(
+            self.model.generate_content_async(
+                f"{prompt}\nFOCUS: Review ONLY {focus}. Use the format above for this aspect alone, 1-3 points per list.\n"
+            )
+            for _, focus in self.ASPECTS.values()
+        ))
+        
+        sections = []
+        scores = []
+        for (heading, _), response in zip(self.ASPECTS.values(), responses):
+            text = response.text.strip()
+            sections.append(f"### {heading}\n{text}")
+            match = self.SCORE_PATTERN.search(text)
+            if match:
+                scores.append(float(match.group(1)))
+        
+        if scores:
+            sections.insert(0, f"## 📊 Overall Score: {sum(scores) / len(scores):.1f} / 10")
+        return "\n\n".join(sections)
+    
     def rate_code(self, code: str, language: str, context: str = "") -> str:
         """
         Rate and review the provided code.
@@ -70,9 +119,8 @@ Please provide a detailed rating and review based on the criteria.
 """
         
         try:
-            response = self.chat.send_message(prompt)
-            self.last_review = response.text
-            return response.text
+            self.last_review = self._review(prompt)
+            return self.last_review
         except Exception as e:
             return f"⚠️ Error rating code: {str(e)}\nPlease try again."
     
@@ -104,5 +152,5 @@ Please answer clearly based on the code analysis.
     
     def reset(self):
         """Reset the rater state."""
-        self.chat = self.model.start_chat(history=[])
+        self.chat.history = []
         self.last_review = None
@@ -1,13 +1,17 @@
 """
 Bug Storage - Persistence layer for Code Made Easy
 """
-import json
+import atexit
 import os
-from dataclasses import dataclass
-from typing import List, Dict
+import queue
+import threading
+import time
+import orjson
+from dataclasses import dataclass, fields
+from typing import List, Dict, Optional
 from datetime import datetime
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class BugRecord:
     """Represents a single bug/mistake record."""
     date: str
@@ -17,81 +21,118 @@ class BugRecord:
     wrong_code: str
     correct_code: str
     explanation: str
-    
-    def to_dict(self) -> Dict:
-        """Convert to dictionary for JSON storage."""
-        return {
-            'date': self.date,
-            'language': self.language,
-            'error_type': self.error_type,
-            'mistake': self.mistake,
-            'wrong_code': self.wrong_code,
-            'correct_code': self.correct_code,
-            'explanation': self.explanation
-        }
-    
-    @classmethod
-    def from_dict(cls, data: Dict) -> 'BugRecord':
-        """Create from dictionary."""
-        return cls(
-            date=data.get('date', ''),
-            language=data.get('language', ''),
-            error_type=data.get('error_type', ''),
-            mistake=data.get('mistake', ''),
-            wrong_code=data.get('wrong_code', ''),
-            correct_code=data.get('correct_code', ''),
-            explanation=data.get('explanation', '')
-        )
-    
-    def display(self) -> str:
-        """Format bug record for display."""
-        return f"""
-┌─────────────────────────────────────────────────────────────────┐
-│ 📅 Date: {self.date:<54}│
-│ 💻 Language: {self.language:<51}│
-│ ⚠️ Error Type: {self.error_type:<49}│
-├─────────────────────────────────────────────────────────────────┤
-│ ❌ Mistake: {self.mistake[:52]:<52}│
-├─────────────────────────────────────────────────────────────────┤
-│ Wrong Code:                                                     │
-│ {self.wrong_code[:60]:<62}│
-├─────────────────────────────────────────────────────────────────┤
-│ Correct Code:                                                   │
-│ {self.correct_code[:60]:<62}│
-├─────────────────────────────────────────────────────────────────┤
-│ 💡 Explanation:                                                 │
-│ {self.explanation[:60]:<62}│
-└─────────────────────────────────────────────────────────────────┘
-"""
+
+_BUG_FIELDS = tuple(f.name for f in fields(BugRecord))
+
+def _record_from_dict(data: Dict) -> BugRecord:
+    """Create a record from stored data, defaulting missing fields to ''."""
+    return BugRecord(**{name: data.get(name, '') for name in _BUG_FIELDS})
 
 class BugStorage:
-    """Handles saving andloading bug records."""
+    """Handles saving andloading bug records (one JSON object per line)."""
+    
+    LEGACY_FILE = "bug_history.json"
+    BATCH_SIZE = 16 # Max records per disk write
+    BATCH_WINDOW = 0.1 # Seconds to wait for more records before writing
     
-    def __init__(self, storage_file: str = "bug_history.json"):
+    def __init__(self, storage_file: str = "bug_history.jsonl"):
         """Initialize bug storage."""
         self.storage_file = storage_file
         self.bugs: List[BugRecord] = []
         self._load()
+        
+        # Disk writes happen on a background thread so the UI never waits on I/O
+        self._queue: "queue.Queue[Optional[BugRecord]]" = queue.Queue()
+        self._writer = threading.Thread(target=self._writer_loop, name="bug-storage-writer", daemon=True)
+        self._writer.start()
+        atexit.register(self.close)
     
     def _load(self):
         """Load bugs from storage file."""
-        if os.path.exists(self.storage_file):
+        if not os.path.exists(self.storage_file):
+            self._migrate_legacy()
+            return
+        
+        with open(self.storage_file, 'rb') as f:
+            for line in f:
+                if not line.strip():
+                    continue
+                try:
+                    data = orjson.loads(line)
+                except orjson.JSONDecodeError:
+                    continue # Skip a torn or corrupt line, keep the rest
+                if isinstance(data, dict):
+                    self.bugs.append(_record_from_dict(data))
+    
+    def _migrate_legacy(self):
+        """Import records from the old single-array JSON file, if present."""
+        if not os.path.exists(self.LEGACY_FILE):
+            return
+        try:
+            with open(self.LEGACY_FILE, 'rb') as f:
+                self.bugs = [_record_from_dict(b) for b in orjson.loads(f.read()) if isinstance(b, dict)]
+        except (orjson.JSONDecodeError, TypeError):
+            self.bugs = []
+            return
+        self._append(self.bugs)
+    
+    def _append(self, bugs: List[BugRecord]):
+        """Append records to the storage file."""
+        with open(self.storage_file, 'ab') as f:
+            f.writelines(orjson.dumps(b) + b'\n' for b in bugs)
+    
+    def _writer_loop(self):
+        """Drain queued records to disk, batching bursts into one write."""
+        while True:
+            bug = self._queue.get()
+            if bug is None:
+                self._queue.task_done()
+                return
+            
+            batch = [bug]
+            stop = False
+            deadline = time.monotonic() + self.BATCH_WINDOW
+            while len(batch) < self.BATCH_SIZE:
+                timeout = deadline - time.monotonic()
+                if timeout <= 0:
+                    break
+                try:
+                    bug = self._queue.get(timeout=timeout)
+                except queue.Empty:
+                    break
+                if bug is None:
+                    stop = True
+                    break
+                batch.append(bug)
+            
             try:
-                with open(self.storage_file, 'r', encoding='utf-8') as f:
-                    data = json.load(f)
-                    self.bugs = [BugRecord.from_dict(b) for b in data]
-            except (json.JSONDecodeError, KeyError):
-                self.bugs = []
+                self._append(batch)
+            except OSError:
+                pass # Nowhere to report from here; the in-memory history is intact
+            finally:
+                for _ in range(len(batch) + stop):
+                    self._queue.task_done()
+            if stop:
+                return
     
-    def _save(self):
-        """Save bugs to storage file."""
-        with open(self.storage_file, 'w', encoding='utf-8') as f:
-            json.dump([b.to_dict() for b in self.bugs], f, indent=2)
+    def flush(self):
+        """Block until every queued record has been written."""
+        self._queue.join()
+    
+    def close(self):
+        """Write pending records and stop the writer thread."""
+        atexit.unregister(self.close) # Don't keep closed instances alive until exit
+        if self._writer.is_alive():
+            self._queue.put(None)
+            self._writer.join()
     
     def add_bug(self, bug: BugRecord):
         """Add a new bug record."""
         self.bugs.append(bug)
-        self._save()
+        if self._writer.is_alive():
+            self._queue.put(bug)
+        else:
+            self._append([bug])
     
     def add_bugs_from_analysis(self, language: str, analysis_text: str):
         """Parse analysis text and extract bugs to save."""
@@ -138,5 +179,7 @@ class BugStorage:
     
     def clear_history(self):
         """Clear all bug history."""
+        self.flush() # Don't let queued records land after the truncate
         self.bugs = []
-        self._save()
+        if os.path.exists(self.storage_file):
+            os.truncate(self.storage_file, 0)
@@ -1,13 +1,16 @@
 """
 Conversation Replay - Chat History Viewer
 """
-import google.generativeai as genai
 from core.logger import ChatLogger
 from core.rich_ui import console, print_header, print_user_msg, print_bot_msg, print_error, print_success, clear_screen
 from rich.table import Table
 from rich import box
+from typing import TYPE_CHECKING
 
-def run_conversation_replay(model: genai.GenerativeModel = None) -> None:
+if TYPE_CHECKING:
+    import google.generativeai as genai
+
+def run_conversation_replay(model: "genai.GenerativeModel" = None) -> None:
     """Main entry for conversation replay."""
     
     while True:
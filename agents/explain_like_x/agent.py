@@ -1,13 +1,15 @@
 """
 Explain Like X - Creative Explanation Engine
 """
-import google.generativeai as genai
-from typing import Optional, List, Dict
+from typing import TYPE_CHECKING, Optional, List, Dict
 import random
 import time
 from core.rich_ui import console, print_header, print_user_msg, print_bot_msg, print_error, print_success, clear_screen, print_menu
 from core.logger import ChatLogger
 
+if TYPE_CHECKING:
+    import google.generativeai as genai
+
 class ExplainLikeX:
     """Explain Like X - The Creative Explanation Engine"""
     
@@ -46,7 +48,7 @@ It should sound like it was created by someone who genuinely lives in or embodie
         "A Harry Potter Wizard", "A Stand-up Comedian", "A Noir Detective", "A Sci-Fi AI"
     ]
 
-    def __init__(self, model: genai.GenerativeModel):
+    def __init__(self, model: "genai.GenerativeModel"):
         self.model = model
     
     def get_explanation(self, topic: str, style: str) -> str:
@@ -62,7 +64,7 @@ It should sound like it was created by someone who genuinely lives in or embodie
         except Exception as e:
             return f"⚠️ Error generating explanation: {str(e)}"
 
-def run_explain_like_x(model: genai.GenerativeModel) -> None:
+def run_explain_like_x(model: "genai.GenerativeModel") -> None:
     """Main entry point for Explain Like X."""
     engine = ExplainLikeX(model)
     session_messages = []
@@ -1,12 +1,14 @@
 """
 Future Simulator - Decision Impact Analysis Module
 """
-import google.generativeai as genai
-from typing import Optional, List, Dict
+from typing import TYPE_CHECKING, Optional, List, Dict
 import time
 from core.rich_ui import console, print_header, print_user_msg, print_bot_msg, print_error, print_success, clear_screen, print_menu
 from core.logger import ChatLogger
 
+if TYPE_CHECKING:
+    import google.generativeai as genai
+
 class FutureSimulator:
     """Future Simulator - Decision Analysis Bot"""
     
@@ -44,7 +46,7 @@ TONE & STYLE:
 - Use clear formatting with emojis for readability.
 """
 
-    def __init__(self, model: genai.GenerativeModel):
+    def __init__(self, model: "genai.GenerativeModel"):
         self.model = model
         self.chat = model.start_chat(history=[
             {"role": "user", "parts": [self.SYSTEM_PROMPT]},
@@ -59,7 +61,7 @@ TONE & STYLE:
         except Exception as e:
             return f"⚠️ Simulation Error: {str(e)}"
 
-def run_future_simulator(model: genai.GenerativeModel) -> None:
+def run_future_simulator(model: "genai.GenerativeModel") -> None:
     """Main entry point for Future Simulator."""
     simulator = FutureSimulator(model)
     session_messages = []
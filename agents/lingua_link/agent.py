@@ -1,13 +1,15 @@
 """
 Lingua Link - Hinglish Chatbot Module
 """
-import google.generativeai as genai
-from typing import Optional, List, Dict
+from typing import TYPE_CHECKING, Optional, List, Dict
 import random
 import time
 from core.logger import ChatLogger
 from core.rich_ui import console, print_header, print_user_msg, print_bot_msg, print_error, print_success, clear_screen
 
+if TYPE_CHECKING:
+    import google.generativeai as genai
+
 class LinguaLink:
     """
     Lingua Link Chatbot - The Desi AI Companion
@@ -51,7 +53,7 @@ YOUR PERSONA:
         "Chalta hu yaar, dua mein yaad rakhna... just kidding, bye!"
     ]
 
-    def __init__(self, model: genai.GenerativeModel):
+    def __init__(self, model: "genai.GenerativeModel"):
         self.model = model
         self.chat = model.start_chat(history=[])
     
@@ -63,7 +65,7 @@ YOUR PERSONA:
         except Exception as e:
             return f"Arre yaar, koi technical glitch ho gaya: {str(e)}. Wapas try kar na please."
 
-def run_lingua_link(model: genai.GenerativeModel) -> None:
+def run_lingua_link(model: "genai.GenerativeModel") -> None:
     """Main entry for Lingua Link chatbot."""
     bot = LinguaLink(model)
     
@@ -1,14 +1,16 @@
 """
 Study Buddy - Academic & Career Guidance Chatbot Module
 """
-import google.generativeai as genai
-from typing import Optional, Dict, Any
+from typing import TYPE_CHECKING, Optional, Dict, Any
 from dataclasses import dataclass, field
 from enum import Enum, auto
 from core.logger import ChatLogger
 from core.rich_ui import console, print_header, print_user_msg, print_bot_msg, print_error, print_success, clear_screen, print_menu
 import time
 
+if TYPE_CHECKING:
+    import google.generativeai as genai
+
 class StudyBuddyFeature(Enum):
     """Features available in Study Buddy."""
     SUBJECT_GUIDE = auto()
@@ -85,7 +87,7 @@ Every response must follow THIS TEMPLATE ONLY:
 ❌ You must NOT add explanations outside this structure
 """
 
-    def __init__(self, model: genai.GenerativeModel):
+    def __init__(self, model: "genai.GenerativeModel"):
         self.model = model
         self.context = SessionContext()
         self.chat = None
@@ -174,7 +176,7 @@ Every response must follow THIS TEMPLATE ONLY:
         self._initialize_chat()
         return "Session reset! Let's start fresh."
 
-def run_study_buddy(model: genai.GenerativeModel) -> None:
+def run_study_buddy(model: "genai.GenerativeModel") -> None:
     buddy = StudyBuddy(model)
     session_messages = []
     
@@ -1,17 +1,22 @@
 """
 Time Travel Chat - Historical Conversation Module (India Edition)
 """
-import google.generativeai as genai
-from typing import Optional, List, Dict
+from typing import TYPE_CHECKING, Optional, List, Dict, Tuple, AsyncIterator
+import asyncio
+import functools
 import random
-import time
-from core.rich_ui import console, print_header, print_user_msg, print_bot_msg, print_error, print_success, clear_screen, print_menu
+import re
+from core.genai_client import run_async
+from core.rich_ui import console, print_header, print_user_msg, print_bot_msg, astream_bot_msg, print_error, print_success, clear_screen, print_menu
 from core.logger import ChatLogger
 
+if TYPE_CHECKING:
+    import google.generativeai as genai
+
 class TimeTravelChat:
     """Time Travel Chat - The Historical Immersion Bot (India Context)"""
     
-    SYSTEM_PROMPT_TEMPLATE = """SYSTEM PROMPT: TIME TRAVEL BOT - INDIA CONTEXT
+    SYSTEM_PROMPT_PREFIX = """SYSTEM PROMPT: TIME TRAVEL BOT - INDIA CONTEXT
 You are a person living in the INDIAN SUBCONTINENT (Bharat/Hindustan) in the year {YEAR}.
 Your identity, knowledge, and worldview are strictly limited to what an Indian person would know in {YEAR}.
 
@@ -30,12 +35,18 @@ LANGUAGE STYLE:
 - Do NOT use modern Gen-Z slang (no "bro", "chill", "vibes").
 
 ERA BEHAVIOR MODIFIERS:
-- Ancient (Before 1200 AD): Discuss Dharma, Philosophy, Kings (Mauryas, Guptas), and Scriptures.
-- Medieval (1200-1750): Discuss the Courts, Art, Invaders, and Bhakti/Sufi movements.
-- British Era (1757-1947): Discuss the struggle for freedom, exploitation, Railways, or Loyalty to the Crown (depending on persona).
-- Post-1947: Discuss Nation Building, Politics, Cinema, Cricket.
-- Future (2025+): Discuss India as a Superpower, Space Missions, Technocracy.
+"""
+
+    # Only the block for the active year's era is sent (all of them if the year can't be parsed)
+    ERA_MODIFIERS = {
+        'ancient': "- Ancient (Before 1200 AD): Discuss Dharma, Philosophy, Kings (Mauryas, Guptas), and Scriptures.\n",
+        'medieval': "- Medieval (1200-1750): Discuss the Courts, Art, Invaders, and Bhakti/Sufi movements.\n",
+        'british': "- British Era (1757-1947): Discuss the struggle for freedom, exploitation, Railways, or Loyalty to the Crown (depending on persona).\n",
+        'post_independence': "- Post-1947: Discuss Nation Building, Politics, Cinema, Cricket.\n",
+        'future': "- Future (2025+): Discuss India as a Superpower, Space Missions, Technocracy.\n",
+    }
 
+    SYSTEM_PROMPT_SUFFIX = """
 ABSOLUTE RULES:
 1. You DO NOT know the future.
 2. You believe {YEAR} is the present.
@@ -45,37 +56,116 @@ ABSOLUTE RULES:
 active_year: {YEAR}
 """
 
-    def __init__(self, model: genai.GenerativeModel):
+    def __init__(self, model: "genai.GenerativeModel"):
         self.model = model
         self.active_year = None
         self.chat = None
+        # (year, prompt) -> reply for turns sent on a fresh timeline, i.e. the
+        # arrival/warp greetings; warping back to a year reuses its greeting
+        self.greetings: Dict[Tuple[str, str], str] = {}
     
     def set_year(self, year: str) -> bool:
         """Set the active year and initialize the chat."""
         try:
             self.active_year = year
-            system_prompt = self.SYSTEM_PROMPT_TEMPLATE.replace("{YEAR}", str(year))
+            history = _build_history(str(year))
             
-            # Initialize chat
-            self.chat = self.model.start_chat(history=[
-                {"role": "user", "parts": [system_prompt]},
-                {"role": "model", "parts": [f"Pranam. I understand. I am living in India in the year {year}."]}
-            ])
+            # Reuse the existing session on warp; only the history changes
+            if self.chat is None:
+                self.chat = self.model.start_chat(history=history)
+            else:
+                self.chat.history = history
             return True
         except Exception:
             return False
 
-    def get_response(self, user_input: str) -> str:
-        """Get a response from the time traveler."""
-        if not self.chat: return "⚠️ Please set a year first."
+    def _is_context_free(self) -> bool:
+        """True while the session holds only its priming turns for the active year."""
+        return len(self.chat.history) == len(_build_history(str(self.active_year)))
+
+    def _cached_response(self, key: Optional[Tuple[str, str]]) -> Optional[str]:
+        """Serve the stored reply for a prompt already sent on this year's fresh timeline."""
+        cached = self.greetings.get(key) if key is not None else None
+        if cached is not None:
+            # Keep the conversation coherent as if the model had answered
+            self.chat.history = [
+                *self.chat.history,
+                {"role": "user", "parts": [key[1]]},
+                {"role": "model", "parts": [cached]},
+            ]
+        return cached
+
+    async def astream_response(self, user_input: str) -> AsyncIterator[str]:
+        """Stream a response from the time traveler without blocking the event loop."""
+        if not self.chat:
+            yield "⚠️ Please set a year first."
+            return
         try:
-            response = self.chat.send_message(user_input)
-            return response.text
+            parts = []
+            # Only exact repeats on a fresh timeline are cached: later turns
+            # depend on the conversation, which the key can't see.
+            key = (str(self.active_year), user_input) if self._is_context_free() else None
+            cached = self._cached_response(key)
+            if cached is not None:
+                yield cached
+                return
+            async for chunk in await self.chat.send_message_async(user_input, stream=True):
+                parts.append(chunk.text)
+                yield chunk.text
+            if key is not None:
+                self.greetings[key] = "".join(parts)
         except Exception as e:
-            return f"⚠️ Transformation error: {str(e)}"
+            if self.chat.last is not None:
+                # The SDK records a streamed reply before it is read; a failed or
+                # blocked one would make every later chat.history read raise
+                self.chat.rewind()
+            # Keep the error off the end of a partially streamed reply
+            separator = "\n\n" if parts else ""
+            yield f"{separator}⚠️ Transformation error: {str(e)}"
+
+    async def aget_response(self, user_input: str) -> str:
+        """Get a response from the time traveler without blocking the event loop."""
+        return "".join([chunk async for chunk in self.astream_response(user_input)])
 
-def run_time_travel(model: genai.GenerativeModel) -> None:
+_YEAR_PATTERN = re.compile(r"^\s*(\d+)\s*(BC|BCE|AD|CE)?\s*$", re.IGNORECASE)
+
+# Templates pre-split on their {YEAR} slot, one per era (None = year not parsed)
+_SYSTEM_PROMPT_PARTS = {
+    era: tuple((TimeTravelChat.SYSTEM_PROMPT_PREFIX + modifier + TimeTravelChat.SYSTEM_PROMPT_SUFFIX).split("{YEAR}"))
+    for era, modifier in [*TimeTravelChat.ERA_MODIFIERS.items(), (None, "".join(TimeTravelChat.ERA_MODIFIERS.values()))]
+}
+
+def _era_for(year: str) -> Optional[str]:
+    """Map a year such as '1857', '300 BC' or '2050 AD' to its era, or None if unparseable."""
+    match = _YEAR_PATTERN.match(year)
+    if not match:
+        return None
+    value = int(match.group(1))
+    if (match.group(2) or "").upper() in ("BC", "BCE") or value < 1200:
+        return 'ancient'
+    if value < 1757:
+        return 'medieval'
+    if value <= 1947:
+        return 'british'
+    if value < 2025:
+        return 'post_independence'
+    return 'future'
+
+@functools.lru_cache(maxsize=64)
+def _build_history(year: str) -> tuple:
+    """Build (once per year) the priming turns for a time travel session."""
+    system_prompt = year.join(_SYSTEM_PROMPT_PARTS[_era_for(year)])
+    return (
+        {"role": "user", "parts": [system_prompt]},
+        {"role": "model", "parts": [f"Pranam. I understand. I am living in India in the year {year}."]},
+    )
+
+def run_time_travel(model: "genai.GenerativeModel") -> None:
     """Main entry point for Time Travel Chat."""
+    run_async(_time_travel_session(model))
+
+async def _time_travel_session(model: "genai.GenerativeModel") -> None:
+    """Async conversation loop so greetings can be fetched while the UI animates."""
     bot = TimeTravelChat(model)
     session_messages = []
     
@@ -93,12 +183,14 @@ def run_time_travel(model: genai.GenerativeModel) -> None:
         if year:
             with console.status(f"[bold yellow]⚡ Traveling to {year} in India...[/bold yellow]", spinner="clock"):
                 bot.set_year(year)
-                time.sleep(1)
+                # Start the greeting request while the travel animation plays
+                greeting_task = asyncio.create_task(bot.aget_response(f"Pranam! What is happening in India in {year}?"))
+                await asyncio.sleep(1)
                 
             print_success(f"Arrived in {year} (India)!")
             
             with console.status("[bold yellow]Awakening local citizen...", spinner="earth"):
-                greeting = bot.get_response(f"Pranam! What is happening in India in {year}?")
+                greeting = await greeting_task
             print_bot_msg(greeting, title=f"Citizen of {year}")
             session_messages.append({"role": "model", "text": greeting})
             break
@@ -132,10 +224,11 @@ def run_time_travel(model: genai.GenerativeModel) -> None:
                 if year and year.lower() not in ['exit', 'quit']:
                     with console.status(f"[bold yellow]⚡ Warping to {year}...[/bold yellow]", spinner="clock"):
                         bot.set_year(year)
-                        time.sleep(1)
+                        greeting_task = asyncio.create_task(bot.aget_response("Pranam! Where are we and what year is this?"))
+                        await asyncio.sleep(1)
                     
                     with console.status("[bold yellow]Stabilizing timeline...", spinner="earth"):
-                        greeting = bot.get_response("Pranam! Where are we and what year is this?")
+                        greeting = await greeting_task
                     print_bot_msg(greeting, title=f"Citizen of {year}")
                     session_messages.append({"role": "model", "text": greeting})
                 continue
@@ -144,13 +237,13 @@ def run_time_travel(model: genai.GenerativeModel) -> None:
             session_messages.append({"role": "user", "text": user_input})
             print_user_msg(user_input)
             
-            with console.status(f"[italic yellow]Thinking in {bot.active_year}...[/italic yellow]", spinner="arc"):
-                response = bot.get_response(user_input)
+            with console.status(f"[italic yellow]Thinking in {bot.active_year}...[/italic yellow]", spinner="arc") as status:
+                response = await astream_bot_msg(bot.astream_response(user_input), title=f"Citizen of {bot.active_year}", status=status)
                 
-            print_bot_msg(response, title=f"Citizen of {bot.active_year}")
             session_messages.append({"role": "model", "text": response})
             
-        except KeyboardInterrupt:
+        except (KeyboardInterrupt, asyncio.CancelledError):
+            # CancelledError: Ctrl-C while a request was being awaited (see run_async)
             console.print("\n\n[yellow]⚠️ Interrupted! Returning to menu...[/yellow]")
             break
         except Exception as e:
@@ -5,13 +5,12 @@ from agents.code_made_easy import run_code_made_easy
 
 if __name__ == "__main__":
     import os
-    import google.generativeai as genai
+    from core.genai_client import get_model
     
     api_key = os.environ.get("GEMINI_API_KEY")
     if not api_key:
         print("⚠️ Please set the GEMINI_API_KEY environment variable")
         exit(1)
     
-    genai.configure(api_key=api_key)
-    model = genai.GenerativeModel('gemini-2.5-flash')
+    model = get_model(api_key)
     run_code_made_easy(model)
@@ -0,0 +1,64 @@
+"""
+Gemini Client - Shared model instance for all agents
+Configures the SDK once so every agent reuses the same pooled transport.
+"""
+import asyncio
+import functools
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    import google.generativeai as genai
+
+DEFAULT_MODEL = 'gemini-2.5-flash'
+
+# The SDK caches its async client, which binds to the first event loop it sees.
+# Keep one loop for the whole process instead of a fresh one per asyncio.run().
+_loop = None
+
+@functools.lru_cache(maxsize=None)
+def get_model(api_key: str, model_name: str = DEFAULT_MODEL) -> "genai.GenerativeModel":
+    """
+    Return the shared model for an API key.
+
+    The SDK keeps one long-lived client (and its keep-alive connection) per
+    configuration, so configuring once and handing the same model to every
+    agent avoids re-doing the TLS handshake on each turn.
+    """
+    import google.generativeai as genai # Deferred: the SDK is slow to import
+    
+    genai.configure(api_key=api_key)
+    return genai.GenerativeModel(model_name)
+
+def _get_loop() -> asyncio.AbstractEventLoop:
+    """Create the shared event loop on first use."""
+    global _loop
+    if _loop is None or _loop.is_closed():
+        _loop = asyncio.new_event_loop()
+    return _loop
+
+def _cancel_pending(loop: asyncio.AbstractEventLoop):
+    """Cancel every task left on the loop and wait for them to unwind."""
+    pending = asyncio.all_tasks(loop)
+    for task in pending:
+        task.cancel()
+    loop.run_until_complete(asyncio.gather(*pending, return_exceptions=True))
+
+def run_async(coro):
+    """
+    Run a coroutine to completion on the shared event loop.
+
+    Ctrl-C arrives outside the coroutine (in the loop's select), so on any
+    escape the coroutine and everything it spawned is cancelled before
+    returning; nothing is left pending for the next call to resume. As with
+    asyncio.Runner, if the coroutine handles the cancellation and returns,
+    its result is returned instead of re-raising.
+    """
+    loop = _get_loop()
+    task = loop.create_task(coro)
+    try:
+        return loop.run_until_complete(task)
+    except BaseException:
+        _cancel_pending(loop)
+        if task.done() and not task.cancelled() and task.exception() is None:
+            return task.result()
+        raise
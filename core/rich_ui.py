@@ -6,10 +6,14 @@ from rich.console import Console
 from rich.theme import Theme
 from rich.panel import Panel
 from rich.text import Text
-from rich.markdown import Markdown
 from rich.align import Align
 from rich.table import Table
+from rich.live import Live
 from rich import box
+from typing import AsyncIterable, List, Sequence, Tuple, Union
+from collections import OrderedDict
+import functools
+import re
 import time
 
 # Define a custom color theme
@@ -28,8 +32,9 @@ THEME = Theme({
 # Global console instance
 console = Console(theme=THEME)
 
-def print_header(title: str, subtitle: str = ""):
-    """Print a styled header."""
+@functools.lru_cache(maxsize=16)
+def _header_panel(title: str, subtitle: str) -> Panel:
+    """Build (once per title/subtitle) the header panel."""
     grid = Table.grid(expand=True)
     grid.add_column(justify="center", ratio=1)
     grid.add_row(f"[bold white]{title}[/bold white]")
@@ -43,7 +48,11 @@ def print_header(title: str, subtitle: str = ""):
         padding=(1, 2),
         box=box.HEAVY
     )
-    console.print(panel)
+    return panel
+
+def print_header(title: str, subtitle: str = ""):
+    """Print a styled header."""
+    console.print(_header_panel(title, subtitle))
     console.print()
 
 def print_user_msg(text: str):
@@ -65,13 +74,8 @@ def print_user_msg(text: str):
     console.print(Align.right(panel))
     # console.print() # spacer
 
-def print_bot_msg(text: str, title: str = "Bot", style: str = "white"):
-    """Print a bot message (left-aligned)."""
-    try:
-        content = Markdown(text)
-    except:
-        content = Text(text)
-        
+def _bot_panel(content, title: str) -> Align:
+    """Build the left-aligned panel used for bot messages."""
     panel = Panel(
         content,
         title=f"[bold green]{title}[/bold green]",
@@ -82,20 +86,79 @@ def print_bot_msg(text: str, title: str = "Bot", style: str = "white"):
         expand=False,
         width=100 # Good width for readability
     )
-    console.print(Align.left(panel))
+    return Align.left(panel)
+
+# Characters that suggest Markdown; anything else renders identically as plain Text
+_MARKDOWN_HINT = re.compile(r"[`*_#>|\[\n]")
+
+@functools.lru_cache(maxsize=64)
+def _markdown(text: str):
+    """Parse a message once; re-displayed responses reuse the parsed tree."""
+    from rich.markdown import Markdown # Deferred: pulls in markdown-it and pygments
+    return Markdown(text)
+
+def print_bot_msg(text: str, title: str = "Bot", style: str = "white"):
+    """Print a bot message (left-aligned)."""
+    content = _markdown(text) if _MARKDOWN_HINT.search(text) else Text(text)
+    console.print(_bot_panel(content, title))
     console.print()
 
-def print_menu(options: dict, title: str = "MAIN MENU"):
-    """Print a nice menu table."""
+async def astream_bot_msg(chunks: AsyncIterable[str], title: str = "Bot", status=None) -> str:
+    """
+    Print a bot message as it streams in and return the full text.
+    If a console.status spinner is passed, it is stopped on the first chunk.
+    """
+    from rich.markdown import Markdown
+    
+    chunks = aiter(chunks)
+    text = await anext(chunks, "")
+    if status is not None:
+        status.stop()
+    
+    # A Live can't redraw a panel taller than the terminal, so the streaming view
+    # is cropped and removed, and the full reply is printed once at the end
+    with Live(_bot_panel(Markdown(text), title), console=console, refresh_per_second=10, vertical_overflow="ellipsis", transient=True) as live:
+        async for chunk in chunks:
+            text += chunk
+            live.update(_bot_panel(Markdown(text), title))
+    print_bot_msg(text, title)
+    return text
+
+def menu_items(options: dict) -> List[Tuple[str, dict]]:
+    """Return menu options as (key, info) pairs in display order."""
+    # Sort keys if they are numeric strings
+    return sorted(options.items(), key=lambda item: int(item[0]) if item[0].isdigit() else 99)
+
+# Built menu panels, most recently used last. Each entry holds a strong ref to
+# its options object, so its id cannot be reused while the entry is cached.
+_menu_panels: "OrderedDict[Tuple[int, str], Tuple[object, Panel]]" = OrderedDict()
+_MENU_CACHE_SIZE = 16
+
+def print_menu(options: Union[dict, Sequence[Tuple[str, dict]]], title: str = "MAIN MENU"):
+    """
+    Print a nice menu table.
+    Pass the result of menu_items() for static menus to skip sorting on every redraw.
+    Menus are treated as static: mutating an options object after it has been
+    printed does not update its cached panel.
+    """
+    key = (id(options), title)
+    if key in _menu_panels:
+        _menu_panels.move_to_end(key)
+    else:
+        _menu_panels[key] = (options, _menu_panel(options, title))
+        if len(_menu_panels) > _MENU_CACHE_SIZE:
+            _menu_panels.popitem(last=False)
+    console.print(_menu_panels[key][1])
+
+def _menu_panel(options: Union[dict, Sequence[Tuple[str, dict]]], title: str) -> Panel:
+    """Build the menu panel."""
     table = Table(box=box.SIMPLE, show_header=False, expand=True, border_style="cyan", padding=(0, 2))
     table.add_column("Key", justify="right", style="bold cyan", width=4)
     table.add_column("Content", justify="left")
     
-    # Sort keys if they are numeric strings
-    sorted_keys = sorted(options.keys(), key=lambda x: int(x) if x.isdigit() else 99)
+    items = menu_items(options) if isinstance(options, dict) else options
     
-    for key in sorted_keys:
-        info = options[key]
+    for key, info in items:
         if info.get('available', True):
             icon = info.get('icon', '🔹')
             name = info.get('name', 'Unknown')
@@ -117,7 +180,7 @@ def print_menu(options: dict, title: str = "MAIN MENU"):
         padding=(1, 1),
         box=box.ROUNDED
     )
-    console.print(panel)
+    return panel
 
 def print_error(msg: str):
     """Print an error message."""
@@ -129,7 +192,12 @@ def print_success(msg: str):
 
 def clear_screen():
     """Clear the terminal screen."""
-    console.clear()
+    if console.is_terminal and not console.legacy_windows:
+        # Clear + cursor home in a single write (POSIX and VT-enabled Windows consoles)
+        console.file.write("\x1b[2J\x1b[H")
+        console.file.flush()
+    else:
+        console.clear()
 
 def stream_thinking(text="Thinking..."):
     """Show a spinner."""
@@ -2,9 +2,9 @@
 import os
 import sys
 import time
-import google.generativeai as genai
-from typing import Callable, Dict, Optional
-from core.rich_ui import console, print_header, print_error, print_success, print_menu, clear_screen
+from typing import TYPE_CHECKING, Callable, Dict, Optional
+from core.rich_ui import console, print_header, print_error, print_success, print_menu, menu_items, clear_screen
+from core.genai_client import get_model
 
 # Import chatbot modules from agents package
 from agents.study_buddy import run_study_buddy
@@ -15,13 +15,16 @@ from agents.time_travel import run_time_travel
 from agents.future_simulator import run_future_simulator
 from agents.conversation_replay import run_conversation_replay
 
+if TYPE_CHECKING:
+    import google.generativeai as genai
+
 
 class ChatbotMenu:
     """Main menu system for the multi-bot chatbot framework."""
     
     def __init__(self):
         """Initialize the chatbot menu system."""
-        self.model: Optional[genai.GenerativeModel] = None
+        self.model: Optional["genai.GenerativeModel"] = None
         self.api_key: Optional[str] = None
         
         # Map of menu options to chatbot functions
@@ -83,6 +86,7 @@ class ChatbotMenu:
                 'available': True
             },
         }
+        self.menu_items = menu_items(self.chatbots)
     
     def setup_gemini(self) -> bool:
         """Setup Gemini API with API key."""
@@ -112,10 +116,8 @@ class ChatbotMenu:
         
         try:
             with console.status("[bold green]Connecting to Google Gemini...", spinner="earth"):
-                # Configure the Gemini API
-                genai.configure(api_key=self.api_key)
-                # Initialize the model
-                self.model = genai.GenerativeModel('gemini-2.5-flash')
+                # Configure the Gemini API and get the shared model
+                self.model = get_model(self.api_key)
                 # Test connection
                 self.model.generate_content("Say 'ready' in one word.")
             
@@ -149,7 +151,7 @@ class ChatbotMenu:
             try:
                 clear_screen()
                 print_header("🤖 Handyware AI Hub", "Select an agent to begin")
-                print_menu(self.chatbots)
+                print_menu(self.menu_items)
                 
                 choice = console.input("\n[bold cyan]👉 Enter your choice:[/bold cyan] ").strip()
                 